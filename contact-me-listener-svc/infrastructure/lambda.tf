@@ -24,6 +24,7 @@ EOF
 
   environment_variables = {
     TOPIC_ARN = aws_sns_topic.contact_me_topic.arn
+    LOG_LEVEL = var.log_level
   }
 
   tags = {
@@ -12,4 +12,8 @@ variable "listener_api_name" {
 
 variable "contact_listener_invoke_path" {
   default = "/services/form/contact"
+}
+
+variable "log_level" {
+  default = "INFO"
 }
\ No newline at end of file
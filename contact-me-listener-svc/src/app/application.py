@@ -1,6 +1,9 @@
 import logging
 from app.common.constants import (TOPIC_ARN_KEY,
+                                  LOG_LEVEL_KEY,
+                                  DEFAULT_LOG_LEVEL,
                                   VALIDATION_FAILURE_MESSAGE,
+                                  MALFORMED_REQUEST_MESSAGE,
                                   FAILURE_EXECUTION,
                                   PUBLISH_FAILURE_MESSAGE,
                                   SUCCESS_EXECUTION,
@@ -12,8 +15,25 @@ from app.util.event_processing_util import EventProcessingUtil
 import json
 import os
 
+
+def resolve_log_level(level_name) -> str:
+    """
+    Normalizes a LOG_LEVEL value, falling back to the default for unknown names so a
+    misconfigured environment can't stop the function from loading.
+    :param: level_name
+    :return: str
+    """
+    level_name = (level_name or "").upper()
+    if isinstance(logging.getLevelName(level_name), int):
+        return level_name
+    return DEFAULT_LOG_LEVEL
+
+
 logger = logging.getLogger("app.Application")
-logger.setLevel(logging.DEBUG)
+logger.setLevel(resolve_log_level(os.environ.get(LOG_LEVEL_KEY)))
+
+# Lambda environment variables are fixed for the life of the container.
+TOPIC_ARN = os.environ.get(TOPIC_ARN_KEY)
 
 
 class Application:
@@ -21,7 +41,14 @@ class Application:
     def __init__(self):
         self._contact_event_validator = ContactEventValidator()
         self._sns_publisher = SNSPublisher()
-        self._topic_arn = os.environ.get(TOPIC_ARN_KEY)
+        self._topic_arn = TOPIC_ARN
+
+        # Responses never vary per request, serialize them once per container. handle() returns
+        # copies so a caller mutating a response can't leak into later invocations.
+        self._malformed_request_response = self.prepare_message(400, FAILURE_EXECUTION, MALFORMED_REQUEST_MESSAGE)
+        self._validation_failure_response = self.prepare_message(400, FAILURE_EXECUTION, VALIDATION_FAILURE_MESSAGE)
+        self._publish_failure_response = self.prepare_message(500, FAILURE_EXECUTION, PUBLISH_FAILURE_MESSAGE)
+        self._publish_success_response = self.prepare_message(200, SUCCESS_EXECUTION, PUBLISH_SUCCESS_MESSAGE)
 
     def handle(self, event):
         """Handle form submit event
@@ -30,25 +57,30 @@ class Application:
         :param: event
         :return:
         """
-        logger.debug("handling event {}".format(str(event)))
+        logger.debug("handling event %s", event)
 
-        contact_event = EventProcessingUtil.extract_relevant_fields(event)
+        try:
+            contact_event = EventProcessingUtil.extract_relevant_fields(event)
+        except ValueError as e:
+            # Client body faults only (missing body, bad base64/UTF-8/JSON, non-object JSON). A
+            # malformed requestContext is an integration fault and surfaces as a server error.
+            logger.warning("Unable to parse submission: %s", e)
+            return dict(self._malformed_request_response)
 
         # Validate Event
         valid_event = self._contact_event_validator.validate_event(contact_event)
 
         if not valid_event:
             logger.warning("Validation failure, preparing failure response.")
-            return self.prepare_message(400, FAILURE_EXECUTION, VALIDATION_FAILURE_MESSAGE)
+            return dict(self._validation_failure_response)
 
         try:
             self._sns_publisher.publish_message(self._topic_arn, json.dumps(contact_event))
         except Exception as e:
-            logger.error("Exception publishing to topic_arn {arn}".format(arn=self._topic_arn))
-            logger.error(e)
-            return self.prepare_message(500, FAILURE_EXECUTION, PUBLISH_FAILURE_MESSAGE)
+            logger.error("Exception publishing to topic_arn %s: %s", self._topic_arn, e)
+            return dict(self._publish_failure_response)
 
-        return self.prepare_message(200, SUCCESS_EXECUTION, PUBLISH_SUCCESS_MESSAGE)
+        return dict(self._publish_success_response)
 
     @staticmethod
     def prepare_message(status_code: int, execution_status, message="none"):
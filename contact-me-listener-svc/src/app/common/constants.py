@@ -1,5 +1,8 @@
 # Environment Variables
 TOPIC_ARN_KEY = "TOPIC_ARN"
+LOG_LEVEL_KEY = "LOG_LEVEL"
+
+DEFAULT_LOG_LEVEL = "INFO"
 
 # Request Fields
 
@@ -15,6 +18,7 @@ FAILURE_EXECUTION = "BAD"
 SUCCESS_EXECUTION = "GOOD"
 
 VALIDATION_FAILURE_MESSAGE = "Submission Failed Validation. Missing Fields"
+MALFORMED_REQUEST_MESSAGE = "Submission could not be parsed."
 PUBLISH_FAILURE_MESSAGE = "Exception publishing contact-me submission."
 PUBLISH_SUCCESS_MESSAGE = "Contact-Me Submission was a Success!"
 GENERIC_FAILURE_MESSAGE = "Processing Error."
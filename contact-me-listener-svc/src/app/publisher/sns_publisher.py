@@ -1,15 +1,25 @@
 import boto3
-import json
+from botocore.config import Config
+
+# Two attempts of 0.5s connect + 1s read fit the function's 3s timeout (the lambda module
+# default), which stays the hard cap if retry backoff pushes a second attempt past it.
+SNS_CLIENT_CONFIG = Config(
+    connect_timeout=0.5,
+    read_timeout=1,
+    tcp_keepalive=True,
+    retries={'total_max_attempts': 2, 'mode': 'standard'}
+)
 
 
 class SNSPublisher:
 
     def __init__(self):
-        self._sns_client = boto3.client("sns")
+        self._sns_client = boto3.client("sns", config=SNS_CLIENT_CONFIG)
 
     def publish_message(self, topic_arn, message_json):
+        # Every subscriber receives the same payload, so publish it as-is rather than
+        # re-encoding it inside a MessageStructure='json' envelope.
         response = self._sns_client.publish(
             TargetArn=topic_arn,
-            Message=json.dumps({'default': message_json}),
-            MessageStructure='json'
+            Message=message_json
         )
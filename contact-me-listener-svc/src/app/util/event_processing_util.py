@@ -20,8 +20,8 @@ class EventProcessingUtil:
 
     @staticmethod
     def _decode_body_to_dict(base64_encoded_body) -> dict:
-        decoded_body = base64.b64decode(base64_encoded_body).decode("utf-8")
-        return json.loads(decoded_body)
+        # json.loads accepts the decoded bytes directly, no intermediate str needed.
+        return json.loads(base64.b64decode(base64_encoded_body))
 
     @staticmethod
     def _extract_request_body(event) -> dict:
@@ -31,11 +31,19 @@ class EventProcessingUtil:
         :param: event
         :return: dict
         """
+        # API Gateway omits the body entirely for empty requests; that's a client error.
+        body = event.get("body")
+        if body is None:
+            raise ValueError("Request body is missing")
+
         event_body = ""
         if event["isBase64Encoded"]:
-            event_body = EventProcessingUtil._decode_body_to_dict(event["body"])
+            event_body = EventProcessingUtil._decode_body_to_dict(body)
         else:
-            event_body = json.loads(event["body"])
+            event_body = json.loads(body)
+
+        if not isinstance(event_body, dict):
+            raise ValueError("Request body must be a JSON object")
 
         return event_body
 
@@ -46,7 +54,8 @@ class EventProcessingUtil:
         :param: event
         :return:
         """
-        request_identifiers = {"userAgent": event["requestContext"]["http"]["userAgent"],
-                              "sourceIP": event["requestContext"]["http"]["sourceIp"]}
+        http_context = event["requestContext"]["http"]
+        request_identifiers = {"userAgent": http_context["userAgent"],
+                               "sourceIP": http_context["sourceIp"]}
 
         return request_identifiers
@@ -1,6 +1,8 @@
 from app.application import Application
 
+# Built at import so the SNS client is created once per container, not per invocation.
+app = Application()
+
 
 def lambda_handler(event, context):
-    app = Application()
     return app.handle(event)
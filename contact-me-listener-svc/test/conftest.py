@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Make the Lambda source root importable the same way the Lambda runtime does.
+SRC_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
@@ -0,0 +1,125 @@
+import base64
+import json
+import unittest
+from unittest.mock import patch
+
+from app.application import Application, resolve_log_level
+from app.common.constants import DEFAULT_LOG_LEVEL, MALFORMED_REQUEST_MESSAGE, PUBLISH_SUCCESS_MESSAGE
+
+
+class TestApplication(unittest.TestCase):
+
+    def setUp(self) -> None:
+        patcher = patch("app.application.SNSPublisher")
+        self.mock_sns_publisher = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+        self.application = Application()
+
+    def test_valid_submission_is_published(self):
+        event = self.get_event(json.dumps({'contactName': 'john',
+                                           'contactEmail': 'john@test.com',
+                                           'contactMessage': 'test message'}))
+
+        response = self.application.handle(event)
+
+        self.assertEqual(200, response['statusCode'])
+        self.assertEqual(PUBLISH_SUCCESS_MESSAGE, json.loads(response['body'])['message:'])
+        self.mock_sns_publisher.publish_message.assert_called_once()
+
+    def test_mutating_a_response_does_not_affect_later_responses(self):
+        event = self.get_event("{not json")
+
+        first_response = self.application.handle(event)
+        first_response['headers'] = {'X-Test': 'true'}
+        second_response = self.application.handle(event)
+
+        self.assertNotIn('headers', second_response)
+
+    def test_invalid_json_body_returns_bad_request(self):
+        event = self.get_event("{not json")
+
+        response = self.application.handle(event)
+
+        self.assertEqual(400, response['statusCode'])
+        self.assertEqual(MALFORMED_REQUEST_MESSAGE, json.loads(response['body'])['message:'])
+        self.mock_sns_publisher.publish_message.assert_not_called()
+
+    def test_non_object_json_body_returns_bad_request(self):
+        for body in ("null", "[1]", "123", '"x"'):
+            with self.subTest(body=body):
+                response = self.application.handle(self.get_event(body))
+
+                self.assertEqual(400, response['statusCode'])
+                self.assertEqual(MALFORMED_REQUEST_MESSAGE, json.loads(response['body'])['message:'])
+
+        self.mock_sns_publisher.publish_message.assert_not_called()
+
+    def test_bad_base64_body_returns_bad_request(self):
+        event = self.get_event("BADBASE64STRING", is_base64_encoded=True)
+
+        response = self.application.handle(event)
+
+        self.assertEqual(400, response['statusCode'])
+        self.mock_sns_publisher.publish_message.assert_not_called()
+
+    def test_missing_body_returns_bad_request(self):
+        event = self.get_event(None)
+
+        response = self.application.handle(event)
+
+        self.assertEqual(400, response['statusCode'])
+        self.mock_sns_publisher.publish_message.assert_not_called()
+
+    def test_absent_body_returns_bad_request(self):
+        event = self.get_event(None)
+        event.pop('body')
+
+        response = self.application.handle(event)
+
+        self.assertEqual(400, response['statusCode'])
+        self.mock_sns_publisher.publish_message.assert_not_called()
+
+    def test_missing_request_context_is_a_server_error(self):
+        event = self.get_event(json.dumps({'contactEmail': 'john@test.com', 'contactMessage': 'test message'}))
+        event.pop('requestContext')
+
+        with self.assertRaises(KeyError):
+            self.application.handle(event)
+
+        self.mock_sns_publisher.publish_message.assert_not_called()
+
+    def test_base64_body_is_decoded(self):
+        body = json.dumps({'contactEmail': 'john@test.com', 'contactMessage': 'test message'})
+        event = self.get_event(base64.b64encode(body.encode("utf-8")).decode("ascii"), is_base64_encoded=True)
+
+        response = self.application.handle(event)
+
+        self.assertEqual(200, response['statusCode'])
+
+    @staticmethod
+    def get_event(body, is_base64_encoded=False):
+        return {'body': body,
+                'isBase64Encoded': is_base64_encoded,
+                'requestContext': {
+                    'http': {
+                        'sourceIp': '152.73.127.80',
+                        'userAgent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15' +
+                                     '(KHTML, like Gecko) Version/15.3 Safari/605.1.15'
+                    }
+                }}
+
+
+class TestResolveLogLevel(unittest.TestCase):
+
+    def test_log_level_is_case_insensitive(self):
+        self.assertEqual("DEBUG", resolve_log_level("debug"))
+
+    def test_unknown_log_level_falls_back_to_default(self):
+        for level_name in ("verbose", "", None):
+            with self.subTest(level_name=level_name):
+                self.assertEqual(DEFAULT_LOG_LEVEL, resolve_log_level(level_name))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,12 +7,6 @@ class TestContactMeEventValidator(unittest.TestCase):
 
     def setUp(self) -> None:
         self._test_validator = ContactEventValidator()
-        self._valid_event = {'contactName': 'john',
-                             'contactEmail': 'john@test.com',
-                             'contactMessage': 'test message',
-                             'userAgent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) ' +
-                                          'AppleWebKit/605.1.15(KHTML, like Gecko) Version/15.3 Safari/605.1.15',
-                             'sourceIP': '152.73.127.80'}
 
 
     def test_valid_event_passes_validation(self):
@@ -1,6 +1,6 @@
 import unittest
 
-from src.app.util.event_processing_util import EventProcessingUtil
+from app.util.event_processing_util import EventProcessingUtil
 from json import JSONDecodeError
 
 class TestEventProcessingUtil(unittest.TestCase):
@@ -0,0 +1,36 @@
+import unittest
+from unittest.mock import patch
+
+from app.publisher.sns_publisher import SNSPublisher
+
+
+class TestSNSPublisher(unittest.TestCase):
+
+    @patch("app.publisher.sns_publisher.boto3.client")
+    def test_publish_forwards_message_json_verbatim(self, mock_boto_client):
+        message_json = '{"contactEmail": "john@test.com", "contactMessage": "test message"}'
+
+        SNSPublisher().publish_message("arn:aws:sns:us-east-1:123456789012:test-topic", message_json)
+
+        mock_boto_client.return_value.publish.assert_called_once_with(
+            TargetArn="arn:aws:sns:us-east-1:123456789012:test-topic",
+            Message=message_json
+        )
+
+    @patch("app.publisher.sns_publisher.boto3.client")
+    def test_tcp_keepalive_enabled(self, mock_boto_client):
+        SNSPublisher()
+
+        config = mock_boto_client.call_args.kwargs["config"]
+        self.assertTrue(config.tcp_keepalive)
+
+    @patch("app.publisher.sns_publisher.boto3.client")
+    def test_retry_budget_is_two_total_attempts(self, mock_boto_client):
+        SNSPublisher()
+
+        config = mock_boto_client.call_args.kwargs["config"]
+        self.assertEqual(2, config.retries["total_max_attempts"])
+
+
+if __name__ == '__main__':
+    unittest.main()